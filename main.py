@@ -2,34 +2,84 @@
 
 import argparse
 import sys
-import os
-from pathlib import Path
 
-# Load environment variables from .env file
-from dotenv import load_dotenv
-load_dotenv()
+# Heavy dependencies (dotenv, fal_client, requests and the src pipeline) are
+# imported inside main() after argument parsing, so --help and usage errors
+# return without paying their import cost.
 
-from src.video_processor import VideoProcessor
-from src.video_generator import VideoGenerator
-from src.video_stitcher import VideoStitcher
-from src.fal_kling_client import FalKlingClient
 
-
-def main():
+def build_parser():
     parser = argparse.ArgumentParser(
         description="Generate videos from images using Kling AI and stitch them together"
     )
     parser.add_argument("input_dir", help="Directory containing images to process")
-    parser.add_argument("prompt", help="Prompt to use for video generation")
-    
+    parser.add_argument("prompt", nargs="?", help="Prompt to use for video generation (not needed with --dry-run)")
+    parser.add_argument(
+        "--window-size", type=int, default=None,
+        help="Generate this many images at a time, appending each window to "
+             "stitched_output.ts and deleting its clips, so peak disk is the output plus "
+             "one window of clips"
+    )
+    parser.add_argument(
+        "--remux-mp4", action="store_true",
+        help="With --window-size, also remux the finished .ts to stitched_output.mp4; "
+             "this briefly needs disk for two copies of the output"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Print a predicted plan (API calls, upload size, time, output size) without calling the API"
+    )
+    parser.add_argument(
+        "--timings", default=None,
+        help="JSON file of per-stage timings: real runs append their measured timings to it, "
+             "--dry-run bases its plan on them (built-in estimates are used without it)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None,
+        help="Concurrent requests to assume for --dry-run (default: as the pipeline would run)"
+    )
+    parser.add_argument(
+        "--cost-per-call", type=float, default=None,
+        help="Price of one API call, to include an estimated cost in the --dry-run plan"
+    )
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
     
+    if not args.dry_run:
+        if args.prompt is None:
+            parser.error("the following arguments are required: prompt")
+        if args.concurrency is not None or args.cost_per_call is not None:
+            parser.error("--concurrency and --cost-per-call only apply with --dry-run")
+    if args.remux_mp4 and not args.window_size:
+        parser.error("--remux-mp4 only applies with --window-size")
+    
+    if args.dry_run:
+        dry_run(args)
+        return
+    
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    from src.video_processor import VideoProcessor
+    from src.video_generator import VideoGenerator
+    from src.video_stitcher import VideoStitcher
+    from src.fal_kling_client import FalKlingClient
+    from src.timing_history import TimingHistory
+    
+    timing_history = None
     try:
         # Create components
-        client = FalKlingClient()
-        video_generator = VideoGenerator(client)
+        timing_history = TimingHistory(args.timings) if args.timings else None
+        client = FalKlingClient(timing_history)
+        video_generator = VideoGenerator(client, timing_history)
         video_stitcher = VideoStitcher()
-        processor = VideoProcessor(video_generator, video_stitcher)
+        processor = VideoProcessor(video_generator, video_stitcher, window_size=args.window_size,
+                                   remux_to_mp4=args.remux_mp4, timing_history=timing_history)
         
         # Process folder
         print(f"Processing images in: {args.input_dir}")
@@ -45,6 +95,26 @@ def main():
     except Exception as e:
         print(f"\nUnexpected error: {e}")
         sys.exit(1)
+    finally:
+        # Keep whatever was measured, even from a failed run
+        if timing_history:
+            timing_history.save()
+
+
+def dry_run(args):
+    from src.job_planner import JobPlanner, StageTimings
+    
+    try:
+        timings = StageTimings.from_file(args.timings) if args.timings else StageTimings()
+        planner = JobPlanner(timings, window_size=args.window_size, remux_to_mp4=args.remux_mp4,
+                             concurrency=args.concurrency, cost_per_call=args.cost_per_call)
+        plan = planner.plan_folder(args.input_dir)
+    except (ValueError, OSError) as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
+    
+    print(f"Dry run for: {args.input_dir}")
+    print(plan.format())
 
 
 if __name__ == "__main__":
@@ -1,18 +1,25 @@
 import os
-import fal_client
+import time
 from src.image_to_video_client import ImageToVideoClient
 
 
 class FalKlingClient(ImageToVideoClient):
-    def __init__(self):
+    def __init__(self, timing_history=None):
         if not os.getenv('FAL_KEY'):
             raise ValueError("FAL_KEY environment variable must be set")
+        self.timing_history = timing_history
     
     def generate_video(self, image_path: str, prompt: str):
+        # Imported here so constructing the client stays cheap
+        import fal_client
+        
         # Upload the image
+        start_time = time.perf_counter()
         image_url = fal_client.upload_file(image_path)
+        upload_seconds = time.perf_counter() - start_time
         
         # Call the API
+        start_time = time.perf_counter()
         result = fal_client.subscribe(
             "fal-ai/kling-video/v1.6/pro/image-to-video",
             arguments={
@@ -22,4 +29,8 @@ class FalKlingClient(ImageToVideoClient):
             with_logs=True
         )
         
-        return result
\ No newline at end of file
+        if self.timing_history:
+            self.timing_history.record('upload', upload_seconds)
+            self.timing_history.record('generate', time.perf_counter() - start_time)
+        
+        return result
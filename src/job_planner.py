@@ -0,0 +1,156 @@
+import math
+import statistics
+from typing import Optional
+
+from src.timing_history import TimingHistory
+from src.video_processor import find_images
+
+
+class StageTimings:
+    """Per-image stage durations (seconds) and clip size used to predict a job."""
+    
+    # Fallbacks used when no history is available for a stage
+    DEFAULTS = {
+        'upload': 2.0,
+        'generate': 300.0,
+        'download': 3.0,
+        'stitch_per_clip': 0.2,
+        'clip_bytes': 5_000_000,
+    }
+    
+    def __init__(self, upload: float = DEFAULTS['upload'], generate: float = DEFAULTS['generate'],
+                 download: float = DEFAULTS['download'], stitch_per_clip: float = DEFAULTS['stitch_per_clip'],
+                 clip_bytes: int = DEFAULTS['clip_bytes']):
+        self.upload = upload
+        self.generate = generate
+        self.download = download
+        self.stitch_per_clip = stitch_per_clip
+        self.clip_bytes = clip_bytes
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'StageTimings':
+        """Load a TimingHistory file, e.g. {"generate": [281.0, 310.5], ...}.
+        
+        Each stage uses the median of its samples; stages without samples
+        keep their default.
+        """
+        values = dict(cls.DEFAULTS)
+        for stage, samples in TimingHistory.load(path).items():
+            values[stage] = statistics.median(samples)
+        values['clip_bytes'] = int(values['clip_bytes'])
+        return cls(**values)
+    
+    @property
+    def per_image(self) -> float:
+        return self.upload + self.generate + self.download
+
+
+class JobPlan:
+    def __init__(self, image_count: int, api_calls: int, upload_bytes: int, concurrency: int,
+                 generation_seconds: float, stitch_seconds: float, output_bytes: int,
+                 cost: Optional[float] = None):
+        self.image_count = image_count
+        self.api_calls = api_calls
+        self.upload_bytes = upload_bytes
+        self.concurrency = concurrency
+        self.generation_seconds = generation_seconds
+        self.stitch_seconds = stitch_seconds
+        self.output_bytes = output_bytes
+        self.cost = cost
+    
+    @property
+    def total_seconds(self) -> float:
+        return self.generation_seconds + self.stitch_seconds
+    
+    def format(self) -> str:
+        lines = [
+            f"Images:            {self.image_count}",
+            f"API calls:         {self.api_calls}",
+            f"Upload:            {_format_bytes(self.upload_bytes)}",
+            f"Concurrency:       {self.concurrency}",
+            f"Generation time:   {_format_duration(self.generation_seconds)}",
+            f"Stitch time:       {_format_duration(self.stitch_seconds)}",
+            f"Total time:        {_format_duration(self.total_seconds)}",
+            f"Expected output:   {_format_bytes(self.output_bytes)}",
+        ]
+        if self.cost is not None:
+            lines.append(f"Estimated cost:    ${self.cost:,.2f}")
+        return "\n".join(lines)
+
+
+class JobPlanner:
+    """Predicts what process_folder would do for a folder without calling the API."""
+    
+    def __init__(self, timings: Optional[StageTimings] = None, window_size: Optional[int] = None,
+                 remux_to_mp4: bool = False, concurrency: Optional[int] = None,
+                 cost_per_call: Optional[float] = None):
+        if window_size is not None and window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if cost_per_call is not None and cost_per_call < 0:
+            raise ValueError("cost_per_call must not be negative")
+        self.timings = timings or StageTimings()
+        self.window_size = window_size
+        self.remux_to_mp4 = remux_to_mp4
+        self.concurrency = concurrency
+        self.cost_per_call = cost_per_call
+    
+    def plan_folder(self, folder_path: str) -> JobPlan:
+        image_files = sorted(find_images(folder_path))
+        if not image_files:
+            raise ValueError("No images found")
+        
+        image_count = len(image_files)
+        upload_bytes = sum(file.stat().st_size for file in image_files)
+        
+        # VideoProcessor runs one thread per image, per window when windowed
+        window = min(self.window_size or image_count, image_count)
+        concurrency = min(self.concurrency or window, window)
+        
+        # Windows run back to back; within a window images run in waves
+        full_windows, last_window = divmod(image_count, window)
+        waves = full_windows * math.ceil(window / concurrency)
+        if last_window:
+            waves += math.ceil(last_window / concurrency)
+        generation_seconds = waves * self.timings.per_image
+        
+        stitch_seconds = self._stitched_clips(image_count) * self.timings.stitch_per_clip
+        
+        cost = None
+        if self.cost_per_call is not None:
+            cost = image_count * self.cost_per_call
+        
+        return JobPlan(
+            image_count=image_count,
+            api_calls=image_count,
+            upload_bytes=upload_bytes,
+            concurrency=concurrency,
+            generation_seconds=generation_seconds,
+            stitch_seconds=stitch_seconds,
+            output_bytes=image_count * self.timings.clip_bytes,
+            cost=cost,
+        )
+    
+    def _stitched_clips(self, image_count: int) -> int:
+        # A single image is written out directly without stitching
+        if image_count == 1:
+            return 0
+        if not self.window_size:
+            return image_count
+        
+        # Each clip is remuxed into the stream, optionally followed by one remux to mp4
+        return 2 * image_count if self.remux_to_mp4 else image_count
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:,.1f} {unit}" if unit != 'B' else f"{int(size)} B"
+        size /= 1024
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m {secs:02d}s"
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+
+class TimingHistory:
+    """Per-stage samples recorded during real runs and read by the dry-run planner."""
+    
+    STAGES = ('upload', 'generate', 'download', 'stitch_per_clip', 'clip_bytes')
+    
+    # Only the most recent samples per stage are kept on save
+    MAX_SAMPLES = 500
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Samples recorded by this run that are not saved yet
+        self._pending: Dict[str, List[float]] = {}
+        self.samples = self._load_or_empty()
+    
+    @classmethod
+    def load(cls, path: str) -> Dict[str, List[float]]:
+        """Read {"stage": [samples...]} from path; a single number per stage is also accepted."""
+        with open(path) as f:
+            try:
+                history = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Timings file {path} is not valid JSON: {e}")
+        
+        if not isinstance(history, dict):
+            raise ValueError(f"Timings file {path} must contain a JSON object of stage samples")
+        
+        samples = {}
+        for stage in cls.STAGES:
+            value = history.get(stage, [])
+            if _is_number(value):
+                value = [value]
+            if not isinstance(value, list) or not all(_is_number(v) for v in value):
+                raise ValueError(f"Timings for '{stage}' must be a number or a list of numbers")
+            if value:
+                samples[stage] = value
+        return samples
+    
+    def record(self, stage: str, value: float):
+        with self._lock:
+            self.samples.setdefault(stage, []).append(value)
+            self._pending.setdefault(stage, []).append(value)
+    
+    def save(self):
+        """Merge this run's samples into the file and replace it atomically.
+        
+        The file is re-read first so samples saved by overlapping runs are
+        kept, and written via a temp file so a killed run never leaves it
+        half-written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        
+        merged = self._load_or_empty()
+        for stage, values in pending.items():
+            merged.setdefault(stage, []).extend(values)
+        merged = {stage: values[-self.MAX_SAMPLES:] for stage, values in merged.items()}
+        
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.timings-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(merged, f, indent=2)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self.samples = merged
+    
+    def _load_or_empty(self) -> Dict[str, List[float]]:
+        # A bad history file must not stop a real run; it is overwritten on save
+        if not Path(self.path).exists():
+            return {}
+        try:
+            return self.load(self.path)
+        except ValueError as e:
+            print(f"Warning: ignoring timings file: {e}")
+            return {}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -1,11 +1,12 @@
 from src.image_to_video_client import ImageToVideoClient
 from pathlib import Path
-import requests
+import time
 
 
 class VideoGenerator:
-    def __init__(self, client: ImageToVideoClient):
+    def __init__(self, client: ImageToVideoClient, timing_history=None):
         self.client = client
+        self.timing_history = timing_history
         
     def generate_video_from_image(self, image_path: str, prompt: str) -> bytes:
         # Call the API
@@ -15,7 +16,14 @@ class VideoGenerator:
         video_url = result['video']['url']
         
         # Download the video
+        import requests
+        start_time = time.perf_counter()
         response = requests.get(video_url)
         response.raise_for_status()
+        content = response.content
         
-        return response.content
\ No newline at end of file
+        if self.timing_history:
+            self.timing_history.record('download', time.perf_counter() - start_time)
+            self.timing_history.record('clip_bytes', len(content))
+        
+        return content
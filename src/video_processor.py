@@ -1,21 +1,30 @@
 from pathlib import Path
 import concurrent.futures
-from typing import List, Tuple
+import time
+from typing import List, Optional, Tuple
+
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+
+def find_images(folder_path: str) -> List[Path]:
+    return [file for file in Path(folder_path).iterdir() if file.suffix.lower() in IMAGE_EXTENSIONS]
 
 
 class VideoProcessor:
-    def __init__(self, video_generator, video_stitcher=None):
+    def __init__(self, video_generator, video_stitcher=None, window_size: Optional[int] = None,
+                 remux_to_mp4: bool = False, timing_history=None):
+        if window_size is not None and window_size < 1:
+            raise ValueError("window_size must be at least 1")
         self.video_generator = video_generator
         self.video_stitcher = video_stitcher
+        self.window_size = window_size
+        self.remux_to_mp4 = remux_to_mp4
+        self.timing_history = timing_history
         
     def process_folder(self, folder_path: str, prompt: str) -> str:
         # Find all image files
-        image_extensions = {'.jpg', '.jpeg', '.png'}
-        image_files = []
-        
-        for file in Path(folder_path).iterdir():
-            if file.suffix.lower() in image_extensions:
-                image_files.append(file)
+        image_files = find_images(folder_path)
         
         if not image_files:
             print("No images found")
@@ -33,26 +42,12 @@ class VideoProcessor:
             # Sort files for consistent ordering
             sorted_files = sorted(image_files)
             
-            # Process images in parallel
-            def process_image(args: Tuple[int, Path]) -> Tuple[int, bytes]:
-                i, image_file = args
-                print(f"Processing image {i+1}/{len(sorted_files)}: {image_file.name}")
-                video_bytes = self.video_generator.generate_video_from_image(str(image_file), prompt)
-                return i, video_bytes
+            if self.window_size:
+                return self._process_in_windows(sorted_files, folder_path, prompt)
             
-            # Use ThreadPoolExecutor for I/O bound tasks
-            with concurrent.futures.ThreadPoolExecutor(max_workers=len(sorted_files)) as executor:
-                # Submit all tasks
-                future_to_index = {
-                    executor.submit(process_image, (i, img)): i 
-                    for i, img in enumerate(sorted_files)
-                }
-                
-                # Collect results in order
-                video_data = [None] * len(sorted_files)
-                for future in concurrent.futures.as_completed(future_to_index):
-                    i, video_bytes = future.result()
-                    video_data[i] = video_bytes
+            output_path = Path(folder_path) / "stitched_output.mp4"
+            
+            video_data = self._generate_videos(sorted_files, prompt, 0, len(sorted_files))
             
             # Write videos to temp files
             video_paths = []
@@ -61,5 +56,82 @@ class VideoProcessor:
                 temp_video_path.write_bytes(video_bytes)
                 video_paths.append(str(temp_video_path))
             
+            return self._timed_stitch(len(video_paths), self.video_stitcher.stitch_videos,
+                                      video_paths, str(output_path))
+    
+    def _generate_videos(self, image_files: List[Path], prompt: str, offset: int, total: int) -> List[bytes]:
+        # Process images in parallel
+        def process_image(args: Tuple[int, Path]) -> Tuple[int, bytes]:
+            i, image_file = args
+            print(f"Processing image {offset+i+1}/{total}: {image_file.name}")
+            video_bytes = self.video_generator.generate_video_from_image(str(image_file), prompt)
+            return i, video_bytes
+        
+        # Use ThreadPoolExecutor for I/O bound tasks
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(image_files)) as executor:
+            # Submit all tasks
+            future_to_index = {
+                executor.submit(process_image, (i, img)): i 
+                for i, img in enumerate(image_files)
+            }
+            
+            # Collect results in order
+            video_data = [None] * len(image_files)
+            for future in concurrent.futures.as_completed(future_to_index):
+                i, video_bytes = future.result()
+                video_data[i] = video_bytes
+        
+        return video_data
+    
+    def _process_in_windows(self, sorted_files: List[Path], folder_path: str, prompt: str) -> str:
+        """Generate, append and discard clips one window at a time.
+        
+        Each window's clips are appended to stitched_output.ts, which is the
+        output itself, and deleted straight away. Peak disk is therefore the
+        output plus window_size clips, and memory one window of clip bytes.
+        With remux_to_mp4 the stream is remuxed to stitched_output.mp4 at the
+        end, which briefly needs disk for both copies of the output.
+        """
+        total = len(sorted_files)
+        stream_path = Path(folder_path) / "stitched_output.ts"
+        stream_path.unlink(missing_ok=True)
+        
+        try:
+            for start in range(0, total, self.window_size):
+                window_files = sorted_files[start:start + self.window_size]
+                video_data = self._generate_videos(window_files, prompt, start, total)
+                
+                # Write this window's videos to temp files
+                clip_paths = []
+                for i, video_bytes in enumerate(video_data):
+                    temp_video_path = Path(folder_path) / f"temp_video_{start + i}.mp4"
+                    temp_video_path.write_bytes(video_bytes)
+                    clip_paths.append(temp_video_path)
+                del video_data
+                
+                try:
+                    self._timed_stitch(len(clip_paths), self.video_stitcher.append_videos,
+                                       [str(path) for path in clip_paths], str(stream_path))
+                finally:
+                    for path in clip_paths:
+                        path.unlink(missing_ok=True)
+            
+            if not self.remux_to_mp4:
+                return str(stream_path)
+            
             output_path = Path(folder_path) / "stitched_output.mp4"
-            return self.video_stitcher.stitch_videos(video_paths, str(output_path))
\ No newline at end of file
+            self._timed_stitch(total, self.video_stitcher.finalize_stream,
+                               str(stream_path), str(output_path))
+            stream_path.unlink()
+            return str(output_path)
+        except BaseException:
+            # Don't leave a partial output behind
+            stream_path.unlink(missing_ok=True)
+            raise
+    
+    def _timed_stitch(self, clip_count: int, stitch, *args) -> str:
+        start_time = time.perf_counter()
+        result = stitch(*args)
+        if self.timing_history:
+            self.timing_history.record('stitch_per_clip', (time.perf_counter() - start_time) / clip_count)
+        return result
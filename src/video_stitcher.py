@@ -1,9 +1,21 @@
 import subprocess
-from typing import List
+import re
+from typing import Dict, List
 import os
 
 
+# Every clip is shifted by this much so none starts with negative timestamps;
+# otherwise the muxer shifts B-frame clips individually and boundaries overlap.
+STREAM_LEAD_SECONDS = 1.0
+
+DURATION_PATTERN = re.compile(rb'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
 class VideoStitcher:
+    def __init__(self):
+        # Where the next clip appended to each stream should start, in seconds
+        self._stream_ends: Dict[str, float] = {}
+    
     def stitch_videos(self, video_paths: List[str], output_path: str) -> str:
         """Stitch multiple videos together using ffmpeg"""
         # Create a temporary file with the list of videos
@@ -32,4 +44,53 @@ class VideoStitcher:
             if os.path.exists(list_file):
                 os.remove(list_file)
                 
-        return output_path
\ No newline at end of file
+        return output_path
+
+    def append_videos(self, video_paths: List[str], stream_path: str) -> str:
+        """Remux videos to MPEG-TS and append them to a growing stream file.
+        
+        MPEG-TS can be concatenated byte for byte, so the stream only ever
+        grows and earlier output is never rewritten. Each clip is offset by
+        the duration already in the stream so timestamps keep increasing.
+        """
+        offset = STREAM_LEAD_SECONDS
+        if os.path.exists(stream_path):
+            offset = self._stream_ends.get(stream_path, STREAM_LEAD_SECONDS)
+        
+        with open(stream_path, 'ab') as stream:
+            for video_path in video_paths:
+                cmd = [
+                    'ffmpeg',
+                    '-i', video_path,
+                    '-c', 'copy',
+                    '-output_ts_offset', f'{offset:.6f}',
+                    '-f', 'mpegts',
+                    'pipe:1'
+                ]
+                
+                result = subprocess.run(cmd, check=True, stdout=stream, stderr=subprocess.PIPE)
+                offset += self._parse_duration(result.stderr, video_path)
+        
+        self._stream_ends[stream_path] = offset
+        return stream_path
+    
+    def finalize_stream(self, stream_path: str, output_path: str) -> str:
+        """Remux an appended MPEG-TS stream into the final mp4"""
+        cmd = [
+            'ffmpeg',
+            '-i', stream_path,
+            '-c', 'copy',
+            '-y',  # Overwrite output file if exists
+            output_path
+        ]
+        
+        subprocess.run(cmd, check=True, capture_output=True)
+        
+        return output_path
+    
+    def _parse_duration(self, ffmpeg_output: bytes, video_path: str) -> float:
+        match = DURATION_PATTERN.search(ffmpeg_output)
+        if not match:
+            raise ValueError(f"Could not read duration of {video_path}")
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
@@ -0,0 +1,122 @@
+import unittest
+import shutil
+import subprocess
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MAIN_SCRIPT = REPO_ROOT / "main.py"
+
+HEAVY_MODULES = ['dotenv', 'fal_client', 'requests', 'src.video_processor',
+                 'src.video_generator', 'src.video_stitcher', 'src.fal_kling_client']
+
+# The planner needs src.video_processor, but never the API client
+API_MODULES = ['dotenv', 'fal_client', 'requests', 'src.fal_kling_client']
+
+# Import time `main.py --help` adds on top of a bare interpreter, as a share of
+# the bare interpreter's own import time. Lazy imports keep it around 15%; the
+# eager dotenv/fal_client/requests imports this guards against push it past 50%.
+STARTUP_IMPORT_BUDGET_RATIO = 0.4
+
+
+class TestCliStartup(unittest.TestCase):
+    
+    def test_help_does_not_import_heavy_modules(self):
+        # When
+        loaded = self.when_listing_modules_loaded_by_cli(['--help'])
+        
+        # Then
+        self.then_no_heavy_modules_were_loaded(loaded)
+    
+    def test_argument_error_does_not_import_heavy_modules(self):
+        # When
+        loaded = self.when_listing_modules_loaded_by_cli([])
+        
+        # Then
+        self.then_no_heavy_modules_were_loaded(loaded)
+    
+    def test_dry_run_does_not_import_api_client(self):
+        # Given
+        folder = self.given_a_folder_with_an_image()
+        
+        # When
+        loaded = self.when_listing_modules_loaded_by_cli([folder, '--dry-run'])
+        
+        # Then
+        self.then_no_api_modules_were_loaded(loaded)
+    
+    def test_help_import_time_is_within_budget(self):
+        # When
+        extra_us, baseline_us = self.when_measuring_extra_import_time([str(MAIN_SCRIPT), '--help'], runs=3)
+        
+        # Then
+        self.then_import_time_is_within_budget(extra_us, baseline_us)
+    
+    def given_a_folder_with_an_image(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        Path(folder, 'photo.jpg').write_bytes(b'\xff\xd8\xff\xe0\x00\x10JFIF')
+        return folder
+    
+    def when_listing_modules_loaded_by_cli(self, cli_args):
+        # Run main() in a fresh interpreter and report every module it imported
+        # or tried to import, so a dependency that is not installed still counts
+        script = (
+            "import sys, runpy\n"
+            "attempted = set()\n"
+            "class _ImportRecorder:\n"
+            "    def find_spec(self, name, path=None, target=None):\n"
+            "        attempted.add(name)\n"
+            "sys.meta_path.insert(0, _ImportRecorder())\n"
+            f"sys.argv = [{str(MAIN_SCRIPT)!r}] + {cli_args!r}\n"
+            f"sys.path.insert(0, {str(REPO_ROOT)!r})\n"
+            "try:\n"
+            f"    runpy.run_path({str(MAIN_SCRIPT)!r}, run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.stderr.write('\\n'.join(attempted | set(sys.modules)))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script],
+                                capture_output=True, text=True, cwd=REPO_ROOT)
+        return set(result.stderr.splitlines())
+    
+    def when_measuring_extra_import_time(self, cli_args, runs):
+        # Median self time (us) of imports the CLI adds over a bare interpreter
+        extras, baselines = [], []
+        for _ in range(runs):
+            baseline = self._import_times(['-c', 'pass'])
+            cli = self._import_times(cli_args)
+            extras.append(sum(us for name, us in cli.items() if name not in baseline))
+            baselines.append(sum(baseline.values()))
+        return statistics.median(extras), statistics.median(baselines)
+    
+    def _import_times(self, args):
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + args,
+                                capture_output=True, text=True, cwd=REPO_ROOT)
+        times = {}
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and 'self [us]' not in line:
+                self_us, _, name = line[len('import time:'):].split('|')
+                times[name.strip()] = int(self_us)
+        return times
+    
+    def then_no_heavy_modules_were_loaded(self, loaded):
+        self.assertIn('argparse', loaded)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, loaded)
+    
+    def then_no_api_modules_were_loaded(self, loaded):
+        self.assertIn('src.job_planner', loaded)
+        for module in API_MODULES:
+            self.assertNotIn(module, loaded)
+    
+    def then_import_time_is_within_budget(self, extra_us, baseline_us):
+        self.assertGreater(baseline_us, 0)
+        self.assertLess(extra_us, baseline_us * STARTUP_IMPORT_BUDGET_RATIO)
+
+
+if __name__ == '__main__':
+    unittest.main()
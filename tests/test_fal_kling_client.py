@@ -81,6 +81,22 @@ class TestFalKlingClient(unittest.TestCase):
         # Then
         self.then_result_matches_expected(result, expected_result)
     
+    @patch('fal_client.subscribe')
+    @patch('fal_client.upload_file')
+    def test_records_upload_and_generate_timings(self, mock_upload, mock_subscribe):
+        # Given
+        self.given_fal_key_in_environment()
+        timing_history = self.given_a_timing_history()
+        client = self.given_client(timing_history)
+        self.given_upload_returns_url(mock_upload)
+        self.given_subscribe_returns_video_result(mock_subscribe)
+        
+        # When
+        self.when_generating_video(client, "/path/to/test.jpg", "test prompt")
+        
+        # Then
+        self.then_stages_were_recorded_once(timing_history, ['upload', 'generate'])
+    
     def given_no_fal_key_in_environment(self):
         # Already done in setUp
         pass
@@ -106,9 +122,17 @@ class TestFalKlingClient(unittest.TestCase):
         self.assertIsInstance(client, FalKlingClient)
         self.assertIsInstance(client, ImageToVideoClient)
     
-    def given_client(self):
+    def given_client(self, timing_history=None):
         from src.fal_kling_client import FalKlingClient
-        return FalKlingClient()
+        return FalKlingClient(timing_history)
+    
+    def given_a_timing_history(self):
+        import tempfile
+        import shutil
+        from src.timing_history import TimingHistory
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        return TimingHistory(os.path.join(temp_dir, 'timings.json'))
     
     def given_upload_returns_url(self, mock_upload):
         uploaded_url = "https://storage.fal.ai/uploaded_image.jpg"
@@ -147,6 +171,11 @@ class TestFalKlingClient(unittest.TestCase):
     
     def then_result_matches_expected(self, actual_result, expected_result):
         self.assertEqual(actual_result, expected_result)
+    
+    def then_stages_were_recorded_once(self, timing_history, stages):
+        self.assertEqual(sorted(timing_history.samples), sorted(stages))
+        for stage in stages:
+            self.assertEqual(len(timing_history.samples[stage]), 1)
 
 
 if __name__ == '__main__':
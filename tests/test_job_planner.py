@@ -0,0 +1,169 @@
+import unittest
+import tempfile
+import shutil
+import json
+from pathlib import Path
+from src.job_planner import JobPlanner, StageTimings
+
+
+class TestJobPlanner(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_empty_folder_raises_exception(self):
+        # Given
+        planner = self.given_a_planner()
+        
+        # When/Then
+        with self.assertRaises(ValueError) as context:
+            planner.plan_folder(self.temp_dir)
+        self.assertIn("No images found", str(context.exception))
+    
+    def test_counts_api_calls_and_upload_bytes_for_images_only(self):
+        # Given
+        planner = self.given_a_planner()
+        folder = self.given_a_folder_with_images(3, size=100)
+        self.given_a_non_image_file(folder)
+        
+        # When
+        plan = planner.plan_folder(folder)
+        
+        # Then
+        self.assertEqual(plan.image_count, 3)
+        self.assertEqual(plan.api_calls, 3)
+        self.assertEqual(plan.upload_bytes, 300)
+        self.assertEqual(plan.output_bytes, 3 * 1000)
+    
+    def test_all_images_run_in_one_wave_by_default(self):
+        # Given
+        planner = self.given_a_planner()
+        folder = self.given_a_folder_with_images(4)
+        
+        # When
+        plan = planner.plan_folder(folder)
+        
+        # Then
+        self.assertEqual(plan.concurrency, 4)
+        self.assertEqual(plan.generation_seconds, 10)
+        self.assertEqual(plan.stitch_seconds, 4)
+    
+    def test_limited_concurrency_runs_in_waves(self):
+        # Given
+        planner = self.given_a_planner(concurrency=2)
+        folder = self.given_a_folder_with_images(5)
+        
+        # When
+        plan = planner.plan_folder(folder)
+        
+        # Then
+        self.assertEqual(plan.generation_seconds, 3 * 10)
+    
+    def test_windowed_plan_appends_each_clip_once(self):
+        # Given
+        planner = self.given_a_planner(window_size=2)
+        folder = self.given_a_folder_with_images(5)
+        
+        # When
+        plan = planner.plan_folder(folder)
+        
+        # Then
+        self.assertEqual(plan.concurrency, 2)
+        self.assertEqual(plan.generation_seconds, 3 * 10)
+        self.assertEqual(plan.stitch_seconds, 5)
+    
+    def test_windowed_plan_with_remux_accounts_for_final_remux(self):
+        # Given
+        planner = self.given_a_planner(window_size=2, remux_to_mp4=True)
+        folder = self.given_a_folder_with_images(5)
+        
+        # When
+        plan = planner.plan_folder(folder)
+        
+        # Then
+        self.assertEqual(plan.stitch_seconds, 5 + 5)
+    
+    def test_single_image_is_not_stitched(self):
+        # Given
+        planner = self.given_a_planner()
+        folder = self.given_a_folder_with_images(1)
+        
+        # When
+        plan = planner.plan_folder(folder)
+        
+        # Then
+        self.assertEqual(plan.stitch_seconds, 0)
+    
+    def test_cost_is_only_estimated_when_price_given(self):
+        # Given
+        folder = self.given_a_folder_with_images(4)
+        
+        # When
+        unpriced = self.given_a_planner().plan_folder(folder)
+        priced = self.given_a_planner(cost_per_call=0.5).plan_folder(folder)
+        
+        # Then
+        self.assertIsNone(unpriced.cost)
+        self.assertEqual(priced.cost, 2.0)
+        self.assertIn("$2.00", priced.format())
+    
+    def test_timings_from_file_use_median_and_keep_defaults(self):
+        # Given
+        timings_file = Path(self.temp_dir) / "timings.json"
+        timings_file.write_text(json.dumps({'generate': [100, 200, 900]}))
+        
+        # When
+        timings = StageTimings.from_file(str(timings_file))
+        
+        # Then
+        self.assertEqual(timings.generate, 200)
+        self.assertEqual(timings.upload, StageTimings.DEFAULTS['upload'])
+    
+    def test_timings_from_file_accept_single_number_per_stage(self):
+        # Given
+        timings_file = self.given_a_timings_file({'generate': 120})
+        
+        # When
+        timings = StageTimings.from_file(str(timings_file))
+        
+        # Then
+        self.assertEqual(timings.generate, 120)
+    
+    def test_timings_from_file_reject_malformed_history(self):
+        for history in ([1, 2], {'generate': 'slow'}, {'generate': [1, None]}):
+            with self.subTest(history=history):
+                # Given
+                timings_file = self.given_a_timings_file(history)
+                
+                # When/Then
+                with self.assertRaises(ValueError):
+                    StageTimings.from_file(str(timings_file))
+    
+    def test_negative_cost_per_call_is_rejected(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            self.given_a_planner(cost_per_call=-0.5)
+    
+    def given_a_timings_file(self, history):
+        timings_file = Path(self.temp_dir) / "timings.json"
+        timings_file.write_text(json.dumps(history))
+        return timings_file
+    
+    def given_a_planner(self, **kwargs):
+        timings = StageTimings(upload=1, generate=8, download=1, stitch_per_clip=1, clip_bytes=1000)
+        return JobPlanner(timings, **kwargs)
+    
+    def given_a_folder_with_images(self, count, size=10):
+        for i in range(count):
+            Path(self.temp_dir, f'photo{i}.jpg').write_bytes(b'x' * size)
+        return self.temp_dir
+    
+    def given_a_non_image_file(self, folder):
+        Path(folder, 'notes.txt').write_text("not an image")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import tempfile
 import shutil
+from io import StringIO
 from pathlib import Path
 from unittest.mock import patch, Mock
 from src.image_to_video_client import MockImageToVideoClient
@@ -44,6 +45,21 @@ class TestVideoProcessor(unittest.TestCase):
         self.then_output_is_video_file(output_path, folder)
         self.then_video_has_expected_size(output_path, 42)  # Mock always returns 42 bytes
     
+    @patch('requests.get')
+    def test_video_generator_records_download_timing_and_clip_size(self, mock_get):
+        # Given
+        self.given_mock_video_download_returns_42_bytes(mock_get)
+        timing_history = self.given_a_timing_history()
+        video_generator = self.given_video_generator_with_mock_client(timing_history)
+        
+        # When
+        video_generator.generate_video_from_image('photo.jpg', "Test prompt")
+        
+        # Then
+        self.assertEqual(sorted(timing_history.samples), ['clip_bytes', 'download'])
+        self.assertEqual(len(timing_history.samples['download']), 1)
+        self.assertEqual(timing_history.samples['clip_bytes'], [42])
+    
     @patch('requests.get')
     def test_folder_with_two_images_creates_stitched_video(self, mock_get):
         # Given
@@ -73,6 +89,64 @@ class TestVideoProcessor(unittest.TestCase):
         # Then
         self.then_processing_took_less_than_sequential_time(elapsed_time, 1.5)
     
+    def test_windowed_processing_stitches_images_in_order(self):
+        # Given
+        processor = self.given_windowed_video_processor(window_size=2)
+        folder = self.given_a_folder_with_images(5)
+        
+        # When
+        output_path = self.when_processing_folder(processor, folder, "Test prompt")
+        
+        # Then
+        self.then_output_is_stitched_video_file_with_content(
+            output_path, folder, b''.join(_clip_bytes(f'photo{i:02d}.jpg') for i in range(5)))
+    
+    def test_windowed_processing_keeps_at_most_one_window_beside_output(self):
+        for image_count in (20, 40):
+            with self.subTest(image_count=image_count):
+                # Given
+                processor = self.given_windowed_video_processor(window_size=2)
+                folder = self.given_a_folder_with_images(image_count)
+                
+                # When
+                self.when_processing_folder(processor, folder, "Test prompt")
+                
+                # Then
+                self.then_stitcher_appended_once_per_window(processor, image_count // 2)
+                self.then_bytes_beside_output_never_exceeded(processor, 2 * CLIP_SIZE)
+                self.then_no_temporary_files_remain(folder)
+    
+    def test_windowed_processing_can_remux_to_mp4(self):
+        # Given
+        processor = self.given_windowed_video_processor(window_size=2, remux_to_mp4=True)
+        folder = self.given_a_folder_with_images(5)
+        
+        # When
+        output_path = self.when_processing_folder(processor, folder, "Test prompt")
+        
+        # Then
+        self.then_output_is_stitched_video_file_with_content(
+            output_path, folder, b''.join(_clip_bytes(f'photo{i:02d}.jpg') for i in range(5)), suffix='.mp4')
+        self.then_peak_disk_was(processor, 2 * 5 * CLIP_SIZE)
+        self.then_no_temporary_files_remain(folder)
+    
+    def test_windowed_processing_records_stitch_timings(self):
+        # Given
+        processor = self.given_windowed_video_processor(window_size=2)
+        processor.timing_history = self.given_a_timing_history()
+        folder = self.given_a_folder_with_images(4)
+        
+        # When
+        self.when_processing_folder(processor, folder, "Test prompt")
+        
+        # Then
+        self.assertEqual(len(processor.timing_history.samples['stitch_per_clip']), 2)
+    
+    def test_window_size_must_be_positive(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            self.given_windowed_video_processor(window_size=0)
+    
     def given_video_processor_with_mock_client(self):
         from src.video_processor import VideoProcessor
         from src.video_generator import VideoGenerator
@@ -80,6 +154,14 @@ class TestVideoProcessor(unittest.TestCase):
         video_generator = VideoGenerator(client)
         return VideoProcessor(video_generator)
     
+    def given_a_timing_history(self):
+        from src.timing_history import TimingHistory
+        return TimingHistory(str(Path(self.temp_dir) / 'timings.json'))
+    
+    def given_video_generator_with_mock_client(self, timing_history=None):
+        from src.video_generator import VideoGenerator
+        return VideoGenerator(MockImageToVideoClient(), timing_history)
+    
     def given_an_empty_folder(self):
         return self.temp_dir
     
@@ -239,6 +321,129 @@ class TestVideoProcessor(unittest.TestCase):
         # Allow some overhead, but should be significantly less than sequential
         self.assertLess(elapsed_time, sequential_time * 0.7)
 
+    
+    def given_windowed_video_processor(self, window_size, remux_to_mp4=False):
+        from src.video_processor import VideoProcessor
+        video_generator = Mock()
+        video_generator.generate_video_from_image.side_effect = (
+            lambda image_path, prompt: _clip_bytes(Path(image_path).name)
+        )
+        return VideoProcessor(video_generator, _ByteAppendStitcher(), window_size=window_size,
+                              remux_to_mp4=remux_to_mp4)
+    
+    def given_a_folder_with_images(self, count):
+        return _write_images(tempfile.mkdtemp(dir=self.temp_dir), count)
+    
+    def then_output_is_stitched_video_file_with_content(self, output_path, folder, expected_content, suffix='.ts'):
+        self.assertEqual(Path(output_path), Path(folder) / f'stitched_output{suffix}')
+        self.assertEqual(Path(output_path).read_bytes(), expected_content)
+    
+    def then_stitcher_appended_once_per_window(self, processor, expected_windows):
+        self.assertEqual(processor.video_stitcher.append_calls, expected_windows)
+    
+    def then_bytes_beside_output_never_exceeded(self, processor, max_bytes):
+        self.assertLessEqual(max(total - stream for total, stream in processor.video_stitcher.disk_usage), max_bytes)
+    
+    def then_peak_disk_was(self, processor, expected_bytes):
+        self.assertEqual(max(total for total, _ in processor.video_stitcher.disk_usage), expected_bytes)
+    
+    def then_no_temporary_files_remain(self, folder):
+        leftovers = [p.name for p in Path(folder).iterdir()
+                     if p.suffix != '.jpg' and not p.name.startswith('stitched_output')]
+        self.assertEqual(leftovers, [])
+        self.assertEqual(len(list(Path(folder).glob('stitched_output*'))), 1)
+
+
+CLIP_SIZE = 100
+
+
+def _clip_bytes(image_name):
+    return f'{image_name};'.encode().ljust(CLIP_SIZE, b'.')
+
+
+def _write_images(folder, count):
+    jpeg_header = b'\xff\xd8\xff\xe0\x00\x10JFIF'
+    for i in range(count):
+        Path(folder, f'photo{i:02d}.jpg').write_bytes(jpeg_header)
+    return folder
+
+
+class _ByteAppendStitcher:
+    # Appends raw clip bytes and records (non-image bytes, stream bytes) on disk at each step
+    def __init__(self):
+        self.append_calls = 0
+        self.disk_usage = []
+    
+    def append_videos(self, video_paths, stream_path):
+        self.append_calls += 1
+        self._record_disk_usage(stream_path)
+        with open(stream_path, 'ab') as stream:
+            for video_path in video_paths:
+                stream.write(Path(video_path).read_bytes())
+        self._record_disk_usage(stream_path)
+        return stream_path
+    
+    def finalize_stream(self, stream_path, output_path):
+        self._record_disk_usage(stream_path)
+        Path(output_path).write_bytes(Path(stream_path).read_bytes())
+        self._record_disk_usage(stream_path)
+        return output_path
+    
+    def _record_disk_usage(self, stream_path):
+        stream = Path(stream_path)
+        total = sum(p.stat().st_size for p in stream.parent.iterdir() if p.suffix != '.jpg')
+        self.disk_usage.append((total, stream.stat().st_size if stream.exists() else 0))
+
+
+class TestDryRunCli(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_dry_run_prints_plan_without_prompt(self):
+        # Given
+        folder = self.given_a_folder_with_images(3)
+        
+        # When
+        output = self.when_running_cli([folder, '--dry-run', '--cost-per-call', '0.5'])
+        
+        # Then
+        self.assertIn("API calls:         3", output)
+        self.assertIn("$1.50", output)
+    
+    def test_dry_run_reports_malformed_timings_file(self):
+        # Given
+        folder = self.given_a_folder_with_images(1)
+        timings_file = Path(self.temp_dir) / "timings.json"
+        timings_file.write_text("[1, 2]")
+        
+        # When/Then
+        with self.assertRaises(SystemExit) as context:
+            self.when_running_cli([folder, '--dry-run', '--timings', str(timings_file)])
+        self.assertEqual(context.exception.code, 1)
+    
+    def test_dry_run_only_flags_are_rejected_without_dry_run(self):
+        # Given
+        folder = self.given_a_folder_with_images(1)
+        
+        # When/Then
+        with patch('sys.stderr', new_callable=StringIO):
+            with self.assertRaises(SystemExit) as context:
+                self.when_running_cli([folder, 'prompt', '--concurrency', '2'])
+        self.assertEqual(context.exception.code, 2)
+    
+    def given_a_folder_with_images(self, count):
+        return _write_images(self.temp_dir, count)
+    
+    def when_running_cli(self, cli_args):
+        import main
+        with patch('sys.argv', ['main.py'] + cli_args), patch('sys.stdout', new_callable=StringIO) as stdout:
+            main.main()
+        return stdout.getvalue()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
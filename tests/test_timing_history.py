@@ -0,0 +1,96 @@
+import unittest
+import tempfile
+import shutil
+import json
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from src.timing_history import TimingHistory
+
+
+class TestTimingHistory(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.history_path = str(Path(self.temp_dir) / "timings.json")
+        
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_recorded_samples_are_appended_to_existing_history(self):
+        # Given
+        self.given_history_file({'generate': [100]})
+        history = TimingHistory(self.history_path)
+        
+        # When
+        history.record('generate', 200)
+        history.record('download', 3)
+        history.save()
+        
+        # Then
+        self.then_history_file_contains({'generate': [100, 200], 'download': [3]})
+    
+    def test_save_keeps_only_most_recent_samples(self):
+        # Given
+        history = TimingHistory(self.history_path)
+        
+        # When
+        for i in range(TimingHistory.MAX_SAMPLES + 5):
+            history.record('upload', i)
+        history.save()
+        
+        # Then
+        samples = TimingHistory.load(self.history_path)['upload']
+        self.assertEqual(len(samples), TimingHistory.MAX_SAMPLES)
+        self.assertEqual(samples[0], 5)
+    
+    def test_overlapping_runs_keep_each_others_samples(self):
+        # Given
+        first_run = TimingHistory(self.history_path)
+        second_run = TimingHistory(self.history_path)
+        
+        # When
+        first_run.record('generate', 100)
+        second_run.record('generate', 200)
+        first_run.save()
+        second_run.save()
+        
+        # Then
+        self.then_history_file_contains({'generate': [100, 200]})
+        self.then_no_temp_files_remain()
+    
+    def test_load_rejects_invalid_json(self):
+        # Given
+        Path(self.history_path).write_text("not json")
+        
+        # When/Then
+        with self.assertRaises(ValueError):
+            TimingHistory.load(self.history_path)
+    
+    def test_corrupt_history_is_ignored_with_warning_and_replaced_on_save(self):
+        # Given
+        Path(self.history_path).write_text('{"generate": [1, 2')
+        
+        # When
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            history = TimingHistory(self.history_path)
+        history.record('generate', 300)
+        with patch('sys.stdout', new_callable=StringIO):
+            history.save()
+        
+        # Then
+        self.assertIn("Warning", stdout.getvalue())
+        self.then_history_file_contains({'generate': [300]})
+    
+    def given_history_file(self, history):
+        Path(self.history_path).write_text(json.dumps(history))
+    
+    def then_history_file_contains(self, expected):
+        self.assertEqual(json.loads(Path(self.history_path).read_text()), expected)
+    
+    def then_no_temp_files_remain(self):
+        self.assertEqual([p.name for p in Path(self.temp_dir).iterdir()], ['timings.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
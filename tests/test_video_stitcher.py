@@ -29,6 +29,40 @@ class TestVideoStitcher(unittest.TestCase):
         self.then_ffmpeg_was_called_with_concat_command(mock_run)
         self.then_all_files_are_in_temp_directory(output_path)
     
+    @patch('src.video_stitcher.subprocess.run')
+    def test_append_videos_remuxes_each_clip_to_mpegts_stream(self, mock_run):
+        self.given_ffmpeg_writes_to_stdout(mock_run, b"ts")
+        stitcher = self.given_a_video_stitcher()
+        video_paths = self.given_three_video_files()
+        stream_path = self.given_an_output_path("stream.ts")
+        
+        stitcher.append_videos(video_paths[:2], stream_path)
+        stitcher.append_videos(video_paths[2:], stream_path)
+        
+        self.then_stream_contains(stream_path, b"tststs")
+        self.then_ffmpeg_was_called_with_format(mock_run, 'mpegts', times=3)
+        self.then_clips_were_offset_by(mock_run, [1.0, 3.5, 6.0])
+    
+    @patch('src.video_stitcher.subprocess.run')
+    def test_finalize_stream_remuxes_to_output(self, mock_run):
+        self.given_ffmpeg_succeeds(mock_run)
+        stitcher = self.given_a_video_stitcher()
+        stream_path = self.given_an_output_path("stream.ts")
+        output_path = self.given_an_output_path("output.mp4")
+        
+        result_path = stitcher.finalize_stream(stream_path, output_path)
+        
+        self.then_output_path_is_returned(result_path, output_path)
+        call_args = mock_run.call_args[0][0]
+        self.assertEqual(call_args[call_args.index('-i') + 1], stream_path)
+        self.assertEqual(call_args[-1], output_path)
+    
+    def given_ffmpeg_writes_to_stdout(self, mock_run, content):
+        def run(cmd, **kwargs):
+            kwargs['stdout'].write(content)
+            return Mock(stderr=b"  Duration: 00:00:02.50, start: 0.000000, bitrate: 1 kb/s")
+        mock_run.side_effect = run
+    
     def given_ffmpeg_succeeds(self, mock_run):
         mock_run.return_value = Mock()
     
@@ -66,6 +100,22 @@ class TestVideoStitcher(unittest.TestCase):
         self.assertIn('-f', call_args)
         self.assertIn('concat', call_args)
     
+    def then_stream_contains(self, stream_path, expected_content):
+        self.assertEqual(Path(stream_path).read_bytes(), expected_content)
+    
+    def then_ffmpeg_was_called_with_format(self, mock_run, fmt, times):
+        self.assertEqual(mock_run.call_count, times)
+        for call in mock_run.call_args_list:
+            call_args = call[0][0]
+            self.assertEqual(call_args[call_args.index('-f') + 1], fmt)
+    
+    def then_clips_were_offset_by(self, mock_run, expected_offsets):
+        offsets = []
+        for call in mock_run.call_args_list:
+            call_args = call[0][0]
+            offsets.append(float(call_args[call_args.index('-output_ts_offset') + 1]))
+        self.assertEqual(offsets, expected_offsets)
+    
     def then_all_files_are_in_temp_directory(self, output_path):
         self.assertTrue(output_path.startswith(self.temp_dir))
 